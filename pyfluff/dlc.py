@@ -7,13 +7,37 @@ uploaded to Furby.
 
 import asyncio
 import logging
+from collections.abc import AsyncGenerator, Collection
+from contextlib import aclosing
 from pathlib import Path
+from typing import Final
+
+import aiofiles
 
 from pyfluff.furby import FurbyConnect
-from pyfluff.protocol import FILE_CHUNK_SIZE, FileTransferMode, FurbyProtocol
+from pyfluff.protocol import (
+    ATT_HEADER_SIZE,
+    DLC_ACK_TIMEOUT,
+    DLC_OVERLOAD_BACKOFF,
+    DLC_WINDOW_SIZE,
+    FILE_CHUNK_SIZE,
+    FileTransferMode,
+    FurbyProtocol,
+    NordicResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from disk at a time while streaming a DLC, rounded down to whole packets
+READ_BLOCK_SIZE: Final[int] = 64 * 1024
+
+# Terminal file transfer states, mapped to the error they report (None on success)
+TRANSFER_RESULTS: Final[dict[FileTransferMode, str | None]] = {
+    FileTransferMode.FILE_RECEIVED_OK: None,
+    FileTransferMode.FILE_RECEIVED_ERROR: "File transfer failed",
+    FileTransferMode.FILE_TRANSFER_TIMEOUT: "File transfer timeout",
+}
+
 
 class DLCManager:
     """Manager for DLC file operations."""
@@ -26,9 +50,10 @@ class DLCManager:
             furby: Connected FurbyConnect instance
         """
         self.furby = furby
-        self._transfer_ready = asyncio.Event()
-        self._transfer_complete = asyncio.Event()
-        self._transfer_error: str | None = None
+        self._transfer_mode: FileTransferMode | None = None
+        self._transfer_changed = asyncio.Event()
+        self._credits: asyncio.Queue[None] | None = None
+        self._overloaded = False
 
     def _file_transfer_callback(self, data: bytes) -> None:
         """Handle file transfer status notifications."""
@@ -39,112 +64,231 @@ class DLCManager:
             mode = FileTransferMode(data[1])
             logger.info(f"File transfer status: {mode.name}")
 
-            if mode == FileTransferMode.READY_TO_RECEIVE:
-                self._transfer_ready.set()
-            elif mode == FileTransferMode.FILE_RECEIVED_OK:
-                self._transfer_complete.set()
-            elif mode == FileTransferMode.FILE_RECEIVED_ERROR:
-                self._transfer_error = "File transfer failed"
-                self._transfer_complete.set()
-            elif mode == FileTransferMode.FILE_TRANSFER_TIMEOUT:
-                self._transfer_error = "File transfer timeout"
-                self._transfer_complete.set()
+            self._transfer_mode = mode
+            self._transfer_changed.set()
 
         except ValueError:
             logger.warning(f"Unknown file transfer mode: {data[1]}")
 
+    async def _wait_for_transfer_mode(
+        self, modes: Collection[FileTransferMode], timeout: float
+    ) -> FileTransferMode:
+        """
+        Wait until Furby reports one of the given file transfer modes.
+
+        Any number of coroutines can wait at once, each for its own modes.
+
+        Args:
+            modes: File transfer modes to wait for
+            timeout: Timeout in seconds
+
+        Returns:
+            The file transfer mode Furby reported
+
+        Raises:
+            TimeoutError: If none of the modes is reported in time
+        """
+
+        async def wait() -> FileTransferMode:
+            while (mode := self._transfer_mode) is None or mode not in modes:
+                self._transfer_changed.clear()
+                await self._transfer_changed.wait()
+            return mode
+
+        return await asyncio.wait_for(wait(), timeout=timeout)
+
+    def _packet_ack_callback(self, data: bytes) -> None:
+        """Handle Nordic packet ACK notifications, returning send credits."""
+        if len(data) < 1:
+            return
+
+        if data[0] == NordicResponse.GOT_PACKET_ACK.value:
+            if self._credits is None:
+                return
+            # The ACK carries the number of packets received since the last one.
+            # Credits are capped at the window so an over-reported count can't
+            # let more packets into flight than Furby asked for.
+            acked = data[1] if len(data) > 1 else 1
+            free = self._credits.maxsize - self._credits.qsize()
+            for _ in range(min(acked, free)):
+                self._credits.put_nowait(None)
+        elif data[0] == NordicResponse.GOT_PACKET_OVERLOAD.value:
+            # Recorded even without credits, fixed pacing backs off too
+            logger.warning("Furby reported packet overload, backing off")
+            self._overloaded = True
+
+    async def _back_off_if_overloaded(self) -> None:
+        """Pause sending once if Furby has reported a packet overload."""
+        if self._overloaded:
+            self._overloaded = False
+            await asyncio.sleep(DLC_OVERLOAD_BACKOFF)
+
+    async def _acquire_credit(self, credits: asyncio.Queue[None]) -> bool:
+        """
+        Wait until Furby has acknowledged enough packets to send another.
+
+        Returns:
+            True if a credit was taken, False if no ACK arrived in time
+        """
+        await self._back_off_if_overloaded()
+
+        try:
+            await asyncio.wait_for(credits.get(), timeout=DLC_ACK_TIMEOUT)
+        except TimeoutError:
+            return False
+        return True
+
+    @staticmethod
+    async def _read_chunks(dlc_path: Path, chunk_size: int) -> AsyncGenerator[bytes, None]:
+        """Stream a DLC file in packet-sized chunks without loading it whole."""
+        # Read every block into the same buffer instead of allocating a new one.
+        # Blocks hold whole packets so none is split across two reads.
+        buffer = bytearray(max(1, READ_BLOCK_SIZE // chunk_size) * chunk_size)
+        view = memoryview(buffer)
+        async with aiofiles.open(dlc_path, "rb") as f:
+            while size := await f.readinto(buffer):
+                block = view[:size]
+                for start in range(0, size, chunk_size):
+                    # Copy each packet out, since the next read overwrites the buffer
+                    yield bytes(block[start : start + chunk_size])
+
     async def upload_dlc(
-        self, dlc_path: Path, slot: int = 2, timeout: float = 60.0, enable_nordic_ack: bool = True
+        self,
+        dlc_path: Path,
+        slot: int = 2,
+        timeout: float = 60.0,
+        enable_nordic_ack: bool = True,
+        window: int = DLC_WINDOW_SIZE,
+        chunk_size: int | None = None,
     ) -> None:
         """
         Upload a DLC file to Furby.
 
+        With Nordic packet ACKs enabled, up to ``window`` packets are kept in
+        flight and each ACK from Furby returns credits to send more. Without ACKs,
+        or if Furby stops sending them, writes fall back to a fixed delay between
+        packets.
+
         Args:
             dlc_path: Path to DLC file
             slot: Slot number to upload to (default: 2)
             timeout: Upload timeout in seconds
-            enable_nordic_ack: Enable Nordic packet ACK for monitoring (default: True)
+            enable_nordic_ack: Enable Nordic packet ACK for flow control (default: True)
+            window: Maximum number of unacknowledged packets in flight
+            chunk_size: Bytes per packet (default: the largest single write the
+                negotiated MTU allows, at least FILE_CHUNK_SIZE)
 
         Raises:
             FileNotFoundError: If DLC file doesn't exist
+            ValueError: If window or chunk_size is less than 1
             RuntimeError: If upload fails
         """
+        if window < 1:
+            raise ValueError(f"DLC window must be at least 1, got {window}")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"DLC chunk size must be at least 1, got {chunk_size}")
         if not dlc_path.exists():
             raise FileNotFoundError(f"DLC file not found: {dlc_path}")
 
-        # Read DLC file
-        dlc_data = dlc_path.read_bytes()
-        file_size = len(dlc_data)
+        file_size = dlc_path.stat().st_size
         filename = dlc_path.name
+        if chunk_size is None:
+            chunk_size = max(FILE_CHUNK_SIZE, self.furby.mtu - ATT_HEADER_SIZE)
 
-        logger.info(f"Uploading DLC: {filename} ({file_size} bytes) to slot {slot}")
+        logger.info(
+            f"Uploading DLC: {filename} ({file_size} bytes) to slot {slot} "
+            f"in {chunk_size}-byte packets"
+        )
 
         # Enable Nordic Packet ACK for monitoring
         if enable_nordic_ack:
             await self.furby.enable_nordic_packet_ack(True)
 
         # Reset transfer state
-        self._transfer_ready.clear()
-        self._transfer_complete.clear()
-        self._transfer_error = None
+        self._transfer_mode = None
+        self._credits = None
+        if enable_nordic_ack:
+            # Start with a full window of send credits
+            self._credits = asyncio.Queue(maxsize=window)
+            for _ in range(window):
+                self._credits.put_nowait(None)
+        self._overloaded = False
 
-        # Add transfer callback
+        # Add transfer callbacks
         self.furby.add_gp_callback(self._file_transfer_callback)
+        self.furby.add_nordic_callback(self._packet_ack_callback)
 
         try:
             # Announce DLC upload
             cmd = FurbyProtocol.build_dlc_announce_command(file_size, slot, filename)
             await self.furby._write_gp(cmd)
 
-            # Wait for ready signal
+            # Wait for ready signal, failing fast if Furby rejects the upload
             try:
-                await asyncio.wait_for(
-                    self._transfer_ready.wait(), timeout=10.0
+                mode = await self._wait_for_transfer_mode(
+                    {FileTransferMode.READY_TO_RECEIVE, *TRANSFER_RESULTS}, timeout=10.0
                 )
             except TimeoutError:
                 raise RuntimeError(
                     "Furby did not respond to DLC upload announcement"
                 ) from None
+            if mode != FileTransferMode.READY_TO_RECEIVE:
+                raise RuntimeError(f"Furby rejected DLC upload: {mode.name}")
 
             # Upload file in chunks
             logger.info("Furby ready, uploading data...")
             offset = 0
             chunk_count = 0
 
-            while offset < file_size:
-                chunk = dlc_data[offset : offset + FILE_CHUNK_SIZE]
-                await self.furby._write_file(chunk)
-                offset += len(chunk)
-                chunk_count += 1
-
-                # Small delay to prevent overwhelming Furby
-                await asyncio.sleep(0.005)
-
-                # Progress logging
-                if chunk_count % 100 == 0:
-                    progress = (offset / file_size) * 100
-                    logger.info(f"Upload progress: {progress:.1f}%")
+            # Close the file promptly even if the loop breaks or raises
+            async with aclosing(self._read_chunks(dlc_path, chunk_size)) as chunks:
+                async for chunk in chunks:
+                    # Stop sending if Furby has already ended the transfer
+                    if self._transfer_mode in TRANSFER_RESULTS:
+                        break
+                    if self._credits is not None and not await self._acquire_credit(
+                        self._credits
+                    ):
+                        logger.warning(
+                            "No packet ACK from Furby, falling back to fixed pacing"
+                        )
+                        self._credits = None
+                    await self.furby._write_file(chunk)
+                    offset += len(chunk)
+                    chunk_count += 1
+
+                    if self._credits is None:
+                        # No ACKs to pace against, small delay to prevent overwhelming Furby
+                        await self._back_off_if_overloaded()
+                        await asyncio.sleep(0.005)
+
+                    # Progress logging
+                    if chunk_count % 100 == 0:
+                        progress = (offset / file_size) * 100
+                        logger.info(f"Upload progress: {progress:.1f}%")
 
             logger.info(f"Uploaded {chunk_count} chunks, waiting for confirmation...")
 
             # Wait for transfer complete
             try:
-                await asyncio.wait_for(
-                    self._transfer_complete.wait(), timeout=timeout
-                )
+                mode = await self._wait_for_transfer_mode(TRANSFER_RESULTS, timeout=timeout)
             except TimeoutError:
                 raise RuntimeError("Timeout waiting for upload confirmation") from None
 
             # Check for errors
-            if self._transfer_error:
-                raise RuntimeError(self._transfer_error)
+            error = TRANSFER_RESULTS[mode]
+            if error:
+                raise RuntimeError(error)
 
             logger.info("DLC upload complete!")
 
         finally:
-            # Remove callback
+            # Remove callbacks
             if self._file_transfer_callback in self.furby._gp_callbacks:
                 self.furby._gp_callbacks.remove(self._file_transfer_callback)
+            if self._packet_ack_callback in self.furby._nordic_callbacks:
+                self.furby._nordic_callbacks.remove(self._packet_ack_callback)
+            self._credits = None
 
     async def load_dlc(self, slot: int) -> None:
         """
@@ -7,16 +7,18 @@ controlling Furby Connect toys via Bluetooth Low Energy.
 
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator, Callable
 
 # Import FurbyCache with TYPE_CHECKING to avoid circular imports
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
 
 from pyfluff.models import FurbyInfo, SensorData
 from pyfluff.protocol import (
+    DEFAULT_ATT_MTU,
     FURBY_NAME,
     IDLE_INTERVAL,
     FurbyCharacteristic,
@@ -30,6 +32,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# FurbyInfo fields and the Device Information characteristics they are read from
+DEVICE_INFO_CHARACTERISTICS: Final[dict[str, str]] = {
+    "manufacturer": FurbyCharacteristic.MANUFACTURER_NAME,
+    "model_number": FurbyCharacteristic.MODEL_NUMBER,
+    "serial_number": FurbyCharacteristic.SERIAL_NUMBER,
+    "hardware_revision": FurbyCharacteristic.HARDWARE_REVISION,
+    "firmware_revision": FurbyCharacteristic.FIRMWARE_REVISION,
+    "software_revision": FurbyCharacteristic.SOFTWARE_REVISION,
+}
+
 
 class FurbyConnect:
     """
@@ -58,6 +70,16 @@ class FurbyConnect:
         """Check if currently connected to a Furby."""
         return self._connected and self.client is not None and self.client.is_connected
 
+    @property
+    def mtu(self) -> int:
+        """Negotiated ATT MTU of the connection, or the BLE default if unknown."""
+        if not self.client or not self.connected:
+            return DEFAULT_ATT_MTU
+        try:
+            return self.client.mtu_size
+        except Exception:
+            return DEFAULT_ATT_MTU
+
     @staticmethod
     async def discover(
         timeout: float = 10.0,
@@ -86,13 +108,9 @@ class FurbyConnect:
         logger.info(f"Found {len(furbies)} Furby device(s)")
 
         # Update cache with discovered Furbies
-        if cache is not None:
-            for device in furbies:
-                cache.add_or_update(
-                    address=device.address,
-                    device_name=device.name
-                )
-                logger.debug(f"Updated cache for {device.address}")
+        if cache is not None and furbies:
+            cache.add_or_update_many((device.address, device.name) for device in furbies)
+            logger.debug(f"Updated cache for {len(furbies)} Furby device(s)")
 
         if len(furbies) == 0:
             logger.warning("No Furbies found. They may be in F2F mode. Try:")
@@ -254,7 +272,8 @@ class FurbyConnect:
 
     def _gp_notification_handler(self, sender: int, data: bytes) -> None:
         """Handle notifications from GeneralPlus characteristic."""
-        logger.debug(f"GP notification: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"GP notification: {data.hex()}")
         for callback in self._gp_callbacks:
             try:
                 callback(data)
@@ -263,7 +282,8 @@ class FurbyConnect:
 
     def _nordic_notification_handler(self, sender: int, data: bytes) -> None:
         """Handle notifications from Nordic characteristic."""
-        logger.debug(f"Nordic notification: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Nordic notification: {data.hex()}")
         for callback in self._nordic_callbacks:
             try:
                 callback(data)
@@ -272,7 +292,8 @@ class FurbyConnect:
 
     def _rssi_notification_handler(self, sender: int, data: bytes) -> None:
         """Handle RSSI notifications."""
-        logger.debug(f"RSSI notification: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"RSSI notification: {data.hex()}")
 
     def add_gp_callback(self, callback: Callable[[bytes], None]) -> None:
         """Add callback for GeneralPlus notifications."""
@@ -312,7 +333,8 @@ class FurbyConnect:
         await self.client.write_gatt_char(
             FurbyCharacteristic.GENERALPLUS_WRITE, data, response=False
         )
-        logger.debug(f"GP write: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"GP write: {data.hex()}")
 
     async def _write_nordic(self, data: bytes) -> None:
         """Write data to Nordic characteristic."""
@@ -322,7 +344,8 @@ class FurbyConnect:
         await self.client.write_gatt_char(
             FurbyCharacteristic.NORDIC_WRITE, data, response=False
         )
-        logger.debug(f"Nordic write: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Nordic write: {data.hex()}")
 
     async def enable_nordic_packet_ack(self, enabled: bool = True) -> None:
         """
@@ -347,7 +370,8 @@ class FurbyConnect:
         await self.client.write_gatt_char(
             FurbyCharacteristic.FILE_WRITE, data, response=False
         )
-        logger.debug(f"File write: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"File write: {data.hex()}")
 
     # High-level command methods
 
@@ -426,6 +450,15 @@ class FurbyConnect:
         await self._write_gp(cmd)
         logger.info(f"Set mood {mood_type.name} to {value} (absolute={set_absolute})")
 
+    async def _read_info_string(self, client: BleakClient, uuid: str, label: str) -> str | None:
+        """Read a Device Information string characteristic, or None if unreadable."""
+        try:
+            data = await client.read_gatt_char(uuid)
+            return data.decode("utf-8").strip("\x00")
+        except Exception as e:
+            logger.warning(f"Could not read {label}: {e}")
+            return None
+
     async def get_device_info(self) -> FurbyInfo:
         """
         Get device information from Furby.
@@ -436,46 +469,15 @@ class FurbyConnect:
         if not self.client or not self.connected:
             raise RuntimeError("Not connected to Furby")
 
-        info = FurbyInfo()
-
-        # Read device information characteristics
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.MANUFACTURER_NAME)
-            info.manufacturer = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read manufacturer: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.MODEL_NUMBER)
-            info.model_number = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read model number: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.SERIAL_NUMBER)
-            info.serial_number = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read serial number: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.HARDWARE_REVISION)
-            info.hardware_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read hardware revision: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.FIRMWARE_REVISION)
-            info.firmware_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read firmware revision: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.SOFTWARE_REVISION)
-            info.software_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read software revision: {e}")
-
-        return info
+        # Issue all reads at once so their round trips overlap; bleak has no
+        # GATT Read Multiple API to fetch them in a single request
+        values = await asyncio.gather(
+            *(
+                self._read_info_string(self.client, uuid, field.replace("_", " "))
+                for field, uuid in DEVICE_INFO_CHARACTERISTICS.items()
+            )
+        )
+        return FurbyInfo(**dict(zip(DEVICE_INFO_CHARACTERISTICS, values, strict=True)))
 
     async def sensor_stream(self) -> AsyncIterator[SensorData]:
         """
@@ -484,8 +486,6 @@ class FurbyConnect:
         Yields:
             SensorData objects with sensor readings
         """
-        import time
-
         queue: asyncio.Queue[bytes] = asyncio.Queue()
 
         def sensor_callback(data: bytes) -> None:
@@ -7,10 +7,15 @@ application to remember previously connected Furbies and provides quick
 access to known devices even when they're in F2F mode.
 """
 
-import json
 import logging
+import os
 import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
 
 from pyfluff.models import KnownFurbiesConfig, KnownFurby
 
@@ -37,6 +42,8 @@ class FurbyCache:
         """
         self.cache_file = Path(cache_file)
         self.config = self._load()
+        self._dirty = False
+        self._batch_depth = 0
 
     def _load(self) -> KnownFurbiesConfig:
         """Load cache from disk."""
@@ -45,26 +52,87 @@ class FurbyCache:
             return KnownFurbiesConfig(furbies={})
 
         try:
-            with open(self.cache_file) as f:
-                data = json.load(f)
-                config = KnownFurbiesConfig(**data)
-                logger.info(f"Loaded {len(config.furbies)} known Furbies from cache")
-                return config
+            # Parse the raw bytes directly, skipping a separate UTF-8 decode pass
+            config = KnownFurbiesConfig.model_validate_json(self.cache_file.read_bytes())
+            # Keep entries ordered oldest to newest; see get_all()
+            config.furbies = self._sorted_by_last_seen(config.furbies)
+            logger.info(f"Loaded {len(config.furbies)} known Furbies from cache")
+            return config
         except Exception as e:
             logger.error(f"Failed to load cache file: {e}")
             logger.warning("Starting with empty cache")
             return KnownFurbiesConfig(furbies={})
 
+    @staticmethod
+    def _sorted_by_last_seen(furbies: dict[str, KnownFurby]) -> dict[str, KnownFurby]:
+        """Return the entries re-inserted in last_seen order, oldest first."""
+        return dict(sorted(furbies.items(), key=lambda item: item[1].last_seen))
+
+    def _insert_by_last_seen(self, address: str, furby: KnownFurby) -> None:
+        """
+        Insert an entry, keeping the dict ordered by last_seen.
+
+        The entry is appended, so it must have been popped first. Its last_seen
+        can still be older than the newest entry (a caller-supplied timestamp or
+        a clock that stepped back), in which case the dict is re-sorted.
+        """
+        newest = next(reversed(self.config.furbies.values()), None)
+        self.config.furbies[address] = furby
+        if newest is not None and furby.last_seen < newest.last_seen:
+            self.config.furbies = self._sorted_by_last_seen(self.config.furbies)
+
+    @staticmethod
+    def _write_blob(path: Path, data: bytes) -> None:
+        """
+        Write pre-serialized cache data to disk atomically.
+
+        The data goes to a temporary file next to the cache that is then
+        renamed over it, so a crash mid-write never leaves a truncated cache.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
     def _save(self) -> None:
         """Save cache to disk."""
         try:
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, "w") as f:
-                json.dump(self.config.model_dump(), f, indent=2)
+            # Serialize straight to JSON bytes (no intermediate dict or str) so
+            # the file is written in one go
+            data = to_json(self.config, indent=2)
+            self._write_blob(self.cache_file, data)
+            self._dirty = False
             logger.debug(f"Saved cache with {len(self.config.furbies)} Furbies")
         except Exception as e:
             logger.error(f"Failed to save cache file: {e}")
 
+    def _mark_dirty(self) -> None:
+        """Record a pending change and save it unless inside a batch."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save pending changes to disk, if there are any."""
+        if self._dirty:
+            self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several cache updates into a single save.
+
+        Saving is deferred until the outermost batch exits, so a scan that
+        sees many Furbies writes the cache file once instead of per device.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
     def add_or_update(
         self,
         address: str,
@@ -72,6 +140,7 @@ class FurbyCache:
         name: str | None = None,
         name_id: int | None = None,
         firmware_revision: str | None = None,
+        last_seen: float | None = None,
     ) -> KnownFurby:
         """
         Add or update a Furby in the cache.
@@ -82,37 +151,64 @@ class FurbyCache:
             name: Furby's name (if known)
             name_id: Furby's name ID (0-128)
             firmware_revision: Firmware version (if known)
+            last_seen: Time the Furby was seen (default: now). Lets a scan stamp
+                every device it found with one timestamp.
             
         Returns:
             The updated KnownFurby entry
         """
-        # Get existing entry or create new one
-        if address in self.config.furbies:
-            furby = self.config.furbies[address]
+        # Collect the fields to update (only those with new values provided)
+        updates: dict[str, Any] = {
+            field: value
+            for field, value in (
+                ("device_name", device_name),
+                ("name", name),
+                ("name_id", name_id),
+                ("firmware_revision", firmware_revision),
+            )
+            if value is not None
+        }
+        # Always update last_seen
+        updates["last_seen"] = time.time() if last_seen is None else last_seen
+
+        # Update existing entry or create new one, popping it so it can be
+        # re-inserted in last_seen order
+        furby = self.config.furbies.pop(address, None)
+        if furby is not None:
+            furby = furby.model_copy(update=updates)
             logger.debug(f"Updating existing Furby: {address}")
         else:
-            furby = KnownFurby(address=address, last_seen=time.time())
+            furby = KnownFurby(address=address, **updates)
             logger.info(f"Adding new Furby to cache: {address}")
 
-        # Update fields (only if new values provided)
-        if device_name is not None:
-            furby.device_name = device_name
-        if name is not None:
-            furby.name = name
-        if name_id is not None:
-            furby.name_id = name_id
-        if firmware_revision is not None:
-            furby.firmware_revision = firmware_revision
-
-        # Always update last_seen
-        furby.last_seen = time.time()
-
         # Save to cache
-        self.config.furbies[address] = furby
-        self._save()
+        self._insert_by_last_seen(address, furby)
+        self._mark_dirty()
 
         return furby
 
+    def add_or_update_many(
+        self, entries: Iterable[tuple[str, str | None]], last_seen: float | None = None
+    ) -> list[KnownFurby]:
+        """
+        Add or update several Furbies in the cache with a single save.
+
+        Args:
+            entries: (MAC address, BLE device name) pairs
+            last_seen: Time the Furbies were seen (default: now)
+
+        Returns:
+            The updated KnownFurby entries
+        """
+        if last_seen is None:
+            last_seen = time.time()
+
+        with self.batch():
+            return [
+                self.add_or_update(address, device_name=device_name, last_seen=last_seen)
+                for address, device_name in entries
+            ]
+
     def get(self, address: str) -> KnownFurby | None:
         """
         Get a Furby from the cache by MAC address.
@@ -132,9 +228,8 @@ class FurbyCache:
         Returns:
             List of all KnownFurby entries, sorted by last_seen (newest first)
         """
-        furbies = list(self.config.furbies.values())
-        furbies.sort(key=lambda f: f.last_seen, reverse=True)
-        return furbies
+        # The dict is kept in last_seen order, oldest first, so no sort is needed
+        return list(reversed(self.config.furbies.values()))
 
     def remove(self, address: str) -> bool:
         """
@@ -146,9 +241,8 @@ class FurbyCache:
         Returns:
             True if removed, False if not found
         """
-        if address in self.config.furbies:
-            del self.config.furbies[address]
-            self._save()
+        if self.config.furbies.pop(address, None) is not None:
+            self._mark_dirty()
             logger.info(f"Removed Furby from cache: {address}")
             return True
         return False
@@ -157,7 +251,7 @@ class FurbyCache:
         """Clear all entries from the cache."""
         count = len(self.config.furbies)
         self.config.furbies.clear()
-        self._save()
+        self._mark_dirty()
         logger.info(f"Cleared cache ({count} entries removed)")
 
     def get_addresses(self) -> list[str]:
@@ -178,14 +272,18 @@ class FurbyCache:
             name: New name
             name_id: New name ID (0-128)
         """
-        if address in self.config.furbies:
-            self.config.furbies[address].name = name
-            self.config.furbies[address].name_id = name_id
-            self.config.furbies[address].last_seen = time.time()
-            self._save()
-            logger.info(f"Updated name for {address}: {name} (ID: {name_id})")
-        else:
+        # Pop the entry so it can be re-inserted in last_seen order
+        furby = self.config.furbies.pop(address, None)
+        if furby is None:
             logger.warning(f"Cannot update name for unknown Furby: {address}")
+            return
+
+        furby.name = name
+        furby.name_id = name_id
+        furby.last_seen = time.time()
+        self._insert_by_last_seen(address, furby)
+        self._mark_dirty()
+        logger.info(f"Updated name for {address}: {name} (ID: {name_id})")
 
     def get_most_recent(self) -> KnownFurby | None:
         """
@@ -194,5 +292,4 @@ class FurbyCache:
         Returns:
             Most recent KnownFurby entry, or None if cache is empty
         """
-        furbies = self.get_all()
-        return furbies[0] if furbies else None
+        return next(reversed(self.config.furbies.values()), None)
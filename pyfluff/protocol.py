@@ -148,11 +148,23 @@ class NordicCommand(Enum):
     PACKET_ACK = 0x09
 
 
+class NordicResponse(Enum):
+    """Nordic microcontroller response identifiers"""
+
+    GOT_PACKET_ACK = 0x09
+    GOT_PACKET_OVERLOAD = 0x0A
+
+
 # Protocol constants
 FURBY_NAME: Final[str] = "Furby"
 MAX_PACKET_SIZE: Final[int] = 20
 IDLE_INTERVAL: Final[float] = 3.0  # seconds
-FILE_CHUNK_SIZE: Final[int] = 20  # bytes per BLE packet
+DEFAULT_ATT_MTU: Final[int] = 23  # bytes, BLE minimum before MTU exchange
+ATT_HEADER_SIZE: Final[int] = 3  # bytes of ATT overhead per write
+FILE_CHUNK_SIZE: Final[int] = 20  # bytes per BLE packet at the default MTU
+DLC_WINDOW_SIZE: Final[int] = 16  # unacknowledged file packets in flight
+DLC_ACK_TIMEOUT: Final[float] = 1.0  # seconds without a packet ACK before fixed pacing
+DLC_OVERLOAD_BACKOFF: Final[float] = 0.1  # seconds to pause after a packet overload
 
 
 class FurbyProtocol:
@@ -111,9 +111,9 @@ async def broadcast_log(message: str, log_type: str = "info") -> None:
 
     log_data = {"message": message, "type": log_type}
 
-    # Send to all connected clients
+    # Send to a snapshot, clients may disconnect while we await each send
     disconnected = []
-    for ws in connection_logs:
+    for ws in list(connection_logs):
         try:
             await ws.send_json(log_data)
         except Exception:
@@ -121,7 +121,8 @@ async def broadcast_log(message: str, log_type: str = "info") -> None:
 
     # Remove disconnected clients
     for ws in disconnected:
-        connection_logs.remove(ws)
+        if ws in connection_logs:
+            connection_logs.remove(ws)
 
 
 # API Endpoints
@@ -515,9 +516,10 @@ async def websocket_logs(websocket: WebSocket) -> None:
     logger.info("Log WebSocket client connected")
 
     try:
-        # Keep connection alive
+        # Block until the client disconnects instead of polling; the client
+        # never sends anything, so this only returns by raising
         while True:
-            await asyncio.sleep(1)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         logger.info("Log WebSocket client disconnected")
         if websocket in connection_logs:
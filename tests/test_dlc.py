@@ -0,0 +1,326 @@
+"""
+Tests for PyFluff DLC module.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pyfluff import dlc
+from pyfluff.dlc import DLCManager
+from pyfluff.protocol import FILE_CHUNK_SIZE, FileTransferMode
+
+
+def test_file_transfer_callback_records_mode() -> None:
+    """Test file transfer notifications update the transfer mode."""
+    manager = DLCManager(MagicMock())
+    manager._file_transfer_callback(bytes([0x24, FileTransferMode.READY_TO_RECEIVE.value]))
+
+    assert manager._transfer_mode == FileTransferMode.READY_TO_RECEIVE
+    assert manager._transfer_changed.is_set()
+
+
+def test_file_transfer_callback_ignores_other_packets() -> None:
+    """Test unrelated or unknown packets are ignored."""
+    manager = DLCManager(MagicMock())
+    manager._file_transfer_callback(bytes([0x21, 0x02]))
+    manager._file_transfer_callback(bytes([0x24, 0xFF]))
+
+    assert manager._transfer_mode is None
+    assert not manager._transfer_changed.is_set()
+
+
+async def test_wait_for_transfer_mode_multiple_waiters() -> None:
+    """Test several coroutines can wait for different transfer modes."""
+    manager = DLCManager(MagicMock())
+    ready = asyncio.create_task(
+        manager._wait_for_transfer_mode({FileTransferMode.READY_TO_RECEIVE}, timeout=1.0)
+    )
+    done = asyncio.create_task(manager._wait_for_transfer_mode(dlc.TRANSFER_RESULTS, timeout=1.0))
+    await asyncio.sleep(0)
+
+    manager._file_transfer_callback(bytes([0x24, FileTransferMode.READY_TO_RECEIVE.value]))
+    assert await ready == FileTransferMode.READY_TO_RECEIVE
+    assert not done.done()
+
+    manager._file_transfer_callback(bytes([0x24, FileTransferMode.FILE_RECEIVED_ERROR.value]))
+    assert await done == FileTransferMode.FILE_RECEIVED_ERROR
+
+
+def make_furby(manager_ref: list[DLCManager], ack_every: int) -> MagicMock:
+    """Build a mock Furby that ACKs file packets in batches of ``ack_every``."""
+    furby = MagicMock()
+    furby._gp_callbacks = []
+    furby._nordic_callbacks = []
+    furby.add_gp_callback = furby._gp_callbacks.append
+    furby.add_nordic_callback = furby._nordic_callbacks.append
+    furby.enable_nordic_packet_ack = AsyncMock()
+    furby.mtu = 23
+    furby.written = []
+    furby.in_flight = 0
+    furby.max_in_flight = 0
+
+    async def write_gp(data: bytes) -> None:
+        if data[0] == 0x50:
+            manager_ref[0]._file_transfer_callback(
+                bytes([0x24, FileTransferMode.READY_TO_RECEIVE.value])
+            )
+
+    async def write_file(data: bytes) -> None:
+        furby.written.append(bytes(data))
+        furby.in_flight += 1
+        furby.max_in_flight = max(furby.max_in_flight, furby.in_flight)
+        if furby.in_flight == ack_every:
+            for callback in list(furby._nordic_callbacks):
+                callback(bytes([0x09, furby.in_flight]))
+            furby.in_flight = 0
+        if sum(len(chunk) for chunk in furby.written) == furby.file_size:
+            manager_ref[0]._file_transfer_callback(
+                bytes([0x24, FileTransferMode.FILE_RECEIVED_OK.value])
+            )
+
+    furby._write_gp = AsyncMock(side_effect=write_gp)
+    furby._write_file = AsyncMock(side_effect=write_file)
+    return furby
+
+
+async def test_upload_dlc_windowed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test uploads stream the file and keep at most ``window`` packets in flight."""
+    # Force several reads so chunks span file read boundaries
+    monkeypatch.setattr(dlc, "READ_BLOCK_SIZE", 70)
+    dlc_data = bytes(range(256)) * 4
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(dlc_data)
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=4)
+    furby.file_size = len(dlc_data)
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    await manager.upload_dlc(dlc_path, slot=2, window=4)
+
+    assert b"".join(furby.written) == dlc_data
+    assert all(len(chunk) <= FILE_CHUNK_SIZE for chunk in furby.written)
+    assert furby.max_in_flight <= 4
+    assert furby._gp_callbacks == []
+    assert furby._nordic_callbacks == []
+
+
+async def test_upload_dlc_falls_back_without_acks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test uploads fall back to fixed pacing when Furby sends no packet ACKs."""
+    monkeypatch.setattr(dlc, "DLC_ACK_TIMEOUT", 0.01)
+    dlc_data = bytes(200)
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(dlc_data)
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=1000)
+    furby.file_size = len(dlc_data)
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    await manager.upload_dlc(dlc_path, slot=2, window=4)
+
+    assert b"".join(furby.written) == dlc_data
+
+
+async def test_upload_dlc_rejects_empty_window(tmp_path: Path) -> None:
+    """Test a window below one packet is rejected up front."""
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(bytes(20))
+    manager = DLCManager(make_furby([], ack_every=1))
+
+    with pytest.raises(ValueError, match="window"):
+        await manager.upload_dlc(dlc_path, slot=2, window=0)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -20])
+async def test_upload_dlc_rejects_bad_chunk_size(tmp_path: Path, chunk_size: int) -> None:
+    """Test a chunk size below one byte is rejected before announcing the upload."""
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(bytes(20))
+    furby = make_furby([], ack_every=1)
+    manager = DLCManager(furby)
+
+    with pytest.raises(ValueError, match="chunk size"):
+        await manager.upload_dlc(dlc_path, slot=2, chunk_size=chunk_size)
+    furby._write_gp.assert_not_called()
+
+
+def test_packet_ack_credits_capped_at_window() -> None:
+    """Test over-reported ACK counts never grow the send window."""
+    manager = DLCManager(MagicMock())
+    manager._credits = asyncio.Queue(maxsize=4)
+    manager._credits.put_nowait(None)
+
+    manager._packet_ack_callback(bytes([0x09, 0xFF]))
+
+    assert manager._credits.qsize() == 4
+
+
+async def test_upload_dlc_backs_off_on_overload_without_acks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test packet overloads still slow fixed-pacing uploads down."""
+    monkeypatch.setattr(dlc, "DLC_OVERLOAD_BACKOFF", 0.02)
+    delays: list[float] = []
+    sleep = asyncio.sleep
+
+    async def recording_sleep(delay: float) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(dlc.asyncio, "sleep", recording_sleep)
+    dlc_data = bytes(60)
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(dlc_data)
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=1000)
+    furby.file_size = len(dlc_data)
+    write_file = furby._write_file.side_effect
+
+    async def overloaded_write_file(data: bytes) -> None:
+        await write_file(data)
+        if len(furby.written) == 1:
+            manager_ref[0]._packet_ack_callback(bytes([0x0A]))
+
+    furby._write_file = AsyncMock(side_effect=overloaded_write_file)
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    await manager.upload_dlc(dlc_path, slot=2, enable_nordic_ack=False)
+
+    assert b"".join(furby.written) == dlc_data
+    assert delays.count(0.02) == 1
+
+
+async def test_upload_dlc_rejected(tmp_path: Path) -> None:
+    """Test uploads fail fast when Furby answers the announcement with an error."""
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(bytes(200))
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=4)
+
+    async def write_gp(data: bytes) -> None:
+        manager_ref[0]._file_transfer_callback(
+            bytes([0x24, FileTransferMode.FILE_RECEIVED_ERROR.value])
+        )
+
+    furby._write_gp = AsyncMock(side_effect=write_gp)
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    with pytest.raises(RuntimeError, match="FILE_RECEIVED_ERROR"):
+        await manager.upload_dlc(dlc_path, slot=2)
+    assert furby.written == []
+
+
+async def test_upload_dlc_chunk_size_follows_mtu(tmp_path: Path) -> None:
+    """Test packets grow to fill a larger negotiated MTU."""
+    dlc_data = bytes(range(256))
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(dlc_data)
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=1)
+    furby.file_size = len(dlc_data)
+    furby.mtu = 103
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    await manager.upload_dlc(dlc_path, slot=2)
+
+    assert [len(chunk) for chunk in furby.written] == [100, 100, 56]
+
+
+async def test_upload_dlc_closes_file_on_early_stop(tmp_path: Path) -> None:
+    """Test the DLC file is closed as soon as the upload stops early."""
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(bytes(200))
+
+    manager_ref: list[DLCManager] = []
+    furby = make_furby(manager_ref, ack_every=1)
+    furby.file_size = 200
+
+    async def write_file(data: bytes) -> None:
+        furby.written.append(bytes(data))
+        manager_ref[0]._file_transfer_callback(
+            bytes([0x24, FileTransferMode.FILE_RECEIVED_ERROR.value])
+        )
+
+    furby._write_file = AsyncMock(side_effect=write_file)
+    manager = DLCManager(furby)
+    manager_ref.append(manager)
+
+    closed = []
+    generators = []
+    read_chunks = manager._read_chunks
+
+    async def tracked(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in read_chunks(path, chunk_size):
+                yield chunk
+        finally:
+            closed.append(True)
+
+    def tracking_read_chunks(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        # Keep a reference so garbage collection can't close the generator for us
+        generator = tracked(path, chunk_size)
+        generators.append(generator)
+        return generator
+
+    manager._read_chunks = tracking_read_chunks  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="File transfer failed"):
+        await manager.upload_dlc(dlc_path, slot=2)
+    assert len(furby.written) == 1
+    assert closed == [True]
+
+
+@pytest.mark.parametrize("chunk_size", [20, 244, 100_000])
+async def test_read_chunks_block_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, chunk_size: int
+) -> None:
+    """Test reads stay within READ_BLOCK_SIZE and hold whole packets."""
+    dlc_data = bytes(range(256)) * 1000
+    dlc_path = tmp_path / "TEST.DLC"
+    dlc_path.write_bytes(dlc_data)
+    read_sizes: list[int] = []
+    open_file = dlc.aiofiles.open
+
+    def tracking_open(*args: object, **kwargs: object) -> object:
+        context = open_file(*args, **kwargs)  # type: ignore[call-overload]
+
+        class Tracking:
+            async def __aenter__(self) -> object:
+                f = await context.__aenter__()
+                readinto = f.readinto
+
+                async def tracking_readinto(buffer: bytearray) -> int:
+                    read_sizes.append(len(buffer))
+                    return await readinto(buffer)
+
+                f.readinto = tracking_readinto
+                return f
+
+            async def __aexit__(self, *exc: object) -> None:
+                await context.__aexit__(*exc)
+
+        return Tracking()
+
+    monkeypatch.setattr(dlc.aiofiles, "open", tracking_open)
+
+    chunks = [chunk async for chunk in DLCManager._read_chunks(dlc_path, chunk_size)]
+
+    assert b"".join(chunks) == dlc_data
+    block_size = read_sizes[0]
+    assert block_size % chunk_size == 0
+    assert block_size <= max(dlc.READ_BLOCK_SIZE, chunk_size)
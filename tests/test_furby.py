@@ -0,0 +1,96 @@
+"""
+Tests for PyFluff FurbyConnect class.
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bleak import BleakScanner
+
+from pyfluff.furby import FurbyConnect
+from pyfluff.furby_cache import FurbyCache
+from pyfluff.protocol import FurbyCharacteristic
+
+
+def make_connected_furby(read_gatt_char: AsyncMock) -> FurbyConnect:
+    """Build a FurbyConnect with a mocked, connected BleakClient."""
+    furby = FurbyConnect()
+    furby.client = MagicMock()
+    furby.client.is_connected = True
+    furby.client.read_gatt_char = read_gatt_char
+    furby._connected = True
+    return furby
+
+
+async def test_get_device_info() -> None:
+    """Test device info is read from each characteristic, tolerating failures."""
+
+    async def read(uuid: str) -> bytearray:
+        if uuid == FurbyCharacteristic.SERIAL_NUMBER:
+            raise OSError("not permitted")
+        return bytearray(f"{uuid[4:8]}\x00".encode())
+
+    furby = make_connected_furby(AsyncMock(side_effect=read))
+    info = await furby.get_device_info()
+
+    assert info.manufacturer == "2a29"
+    assert info.model_number == "2a24"
+    assert info.serial_number is None
+    assert info.hardware_revision == "2a27"
+    assert info.firmware_revision == "2a26"
+    assert info.software_revision == "2a28"
+
+
+async def test_get_device_info_reads_concurrently() -> None:
+    """Test all characteristic reads are in flight at the same time."""
+    started: list[str] = []
+    all_started = asyncio.Event()
+
+    async def read(uuid: str) -> bytearray:
+        started.append(uuid)
+        if len(started) == 6:
+            all_started.set()
+        # Sequential reads would block here forever on the first one
+        await all_started.wait()
+        return bytearray(b"x")
+
+    furby = make_connected_furby(AsyncMock(side_effect=read))
+    info = await asyncio.wait_for(furby.get_device_info(), timeout=1.0)
+
+    assert info.manufacturer == "x"
+    assert len(started) == 6
+
+
+async def test_get_device_info_not_connected() -> None:
+    """Test reading device info requires a connection."""
+    with pytest.raises(RuntimeError):
+        await FurbyConnect().get_device_info()
+
+
+def test_mtu() -> None:
+    """Test the MTU falls back to the BLE default when unknown."""
+    furby = FurbyConnect()
+    assert furby.mtu == 23
+
+    furby = make_connected_furby(AsyncMock())
+    furby.client.mtu_size = 247
+    assert furby.mtu == 247
+
+
+async def test_discover_updates_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test discovered Furbies are added to the cache, ignoring other devices."""
+    devices = [
+        MagicMock(address="AA:BB:CC:DD:EE:01", spec=["address", "name"]),
+        MagicMock(address="AA:BB:CC:DD:EE:02", spec=["address", "name"]),
+    ]
+    devices[0].name = "Furby"
+    devices[1].name = "Headphones"
+    monkeypatch.setattr(BleakScanner, "discover", AsyncMock(return_value=devices))
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+
+    furbies = await FurbyConnect.discover(timeout=0.1, cache=cache)
+
+    assert furbies == [devices[0]]
+    assert [f.address for f in cache.get_all()] == ["AA:BB:CC:DD:EE:01"]
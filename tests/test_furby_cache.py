@@ -0,0 +1,234 @@
+"""
+Tests for PyFluff Furby cache module.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from pyfluff.furby_cache import FurbyCache
+
+
+def test_save_and_reload(tmp_path: Path) -> None:
+    """Test cache entries survive a save/load round trip."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache = FurbyCache(cache_file)
+    cache.add_or_update("AA:BB:CC:DD:EE:FF", device_name="Furby", name="Dah-Boh", name_id=1)
+
+    reloaded = FurbyCache(cache_file)
+    furby = reloaded.get("AA:BB:CC:DD:EE:FF")
+    assert furby is not None
+    assert furby.device_name == "Furby"
+    assert furby.name == "Dah-Boh"
+    assert furby.name_id == 1
+
+
+def test_save_creates_parent_directory(tmp_path: Path) -> None:
+    """Test saving creates missing parent directories."""
+    cache_file = tmp_path / "nested" / "known_furbies.json"
+    cache = FurbyCache(cache_file)
+    cache.add_or_update("AA:BB:CC:DD:EE:FF")
+
+    data = json.loads(cache_file.read_text())
+    assert "AA:BB:CC:DD:EE:FF" in data["furbies"]
+    assert not cache_file.with_name("known_furbies.json.tmp").exists()
+
+
+def test_load_corrupt_file(tmp_path: Path) -> None:
+    """Test a corrupt cache file falls back to an empty cache."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache_file.write_text("{not json")
+
+    cache = FurbyCache(cache_file)
+    assert cache.get_all() == []
+
+
+def test_batch_saves_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test updates inside a batch are written to disk once."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    writes: list[bytes] = []
+    monkeypatch.setattr(cache, "_write_blob", lambda path, data: writes.append(data))
+
+    with cache.batch():
+        for i in range(5):
+            cache.add_or_update(f"AA:BB:CC:DD:EE:0{i}", device_name="Furby")
+        assert writes == []
+
+    assert len(writes) == 1
+    assert len(json.loads(writes[0])["furbies"]) == 5
+
+
+def test_flush_without_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test flushing a clean cache does not touch the disk."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    writes: list[bytes] = []
+    monkeypatch.setattr(cache, "_write_blob", lambda path, data: writes.append(data))
+
+    cache.flush()
+    with cache.batch():
+        pass
+
+    assert writes == []
+
+    # A flush right after a batch has saved must not write the same data again
+    with cache.batch():
+        cache.add_or_update("AA:BB:CC:DD:EE:FF")
+    cache.flush()
+
+    assert len(writes) == 1
+
+
+def test_get_all_newest_first(tmp_path: Path) -> None:
+    """Test get_all orders entries by last_seen, newest first."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    cache.add_or_update("AA:BB:CC:DD:EE:01")
+    cache.add_or_update("AA:BB:CC:DD:EE:02")
+    cache.add_or_update("AA:BB:CC:DD:EE:01")
+
+    addresses = [f.address for f in cache.get_all()]
+    assert addresses == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"]
+
+    cache.update_name("AA:BB:CC:DD:EE:02", "Ah-Bay", 2)
+    assert cache.get_all()[0].address == "AA:BB:CC:DD:EE:02"
+
+
+def test_load_orders_by_last_seen(tmp_path: Path) -> None:
+    """Test entries loaded from disk are ordered by last_seen."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache_file.write_text(
+        json.dumps(
+            {
+                "furbies": {
+                    "AA:BB:CC:DD:EE:01": {"address": "AA:BB:CC:DD:EE:01", "last_seen": 3.0},
+                    "AA:BB:CC:DD:EE:02": {"address": "AA:BB:CC:DD:EE:02", "last_seen": 1.0},
+                    "AA:BB:CC:DD:EE:03": {"address": "AA:BB:CC:DD:EE:03", "last_seen": 2.0},
+                }
+            }
+        )
+    )
+
+    cache = FurbyCache(cache_file)
+    addresses = [f.address for f in cache.get_all()]
+    assert addresses == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:03", "AA:BB:CC:DD:EE:02"]
+
+
+def test_get_most_recent(tmp_path: Path) -> None:
+    """Test get_most_recent returns the last updated Furby."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    assert cache.get_most_recent() is None
+
+    cache.add_or_update("AA:BB:CC:DD:EE:01")
+    cache.add_or_update("AA:BB:CC:DD:EE:02")
+    most_recent = cache.get_most_recent()
+    assert most_recent is not None
+    assert most_recent.address == "AA:BB:CC:DD:EE:02"
+
+
+def test_add_or_update_keeps_known_fields(tmp_path: Path) -> None:
+    """Test updating an entry only overwrites the fields provided."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    first = cache.add_or_update("AA:BB:CC:DD:EE:FF", device_name="Furby", name="Dah-Boh", name_id=1)
+    updated = cache.add_or_update("AA:BB:CC:DD:EE:FF", firmware_revision="1.0")
+
+    assert updated.device_name == "Furby"
+    assert updated.name == "Dah-Boh"
+    assert updated.name_id == 1
+    assert updated.firmware_revision == "1.0"
+    assert updated.last_seen >= first.last_seen
+    assert cache.get("AA:BB:CC:DD:EE:FF") is updated
+
+
+def test_update_name_and_remove(tmp_path: Path) -> None:
+    """Test renaming and removing entries, including unknown addresses."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    cache.add_or_update("AA:BB:CC:DD:EE:FF")
+
+    cache.update_name("AA:BB:CC:DD:EE:FF", "Dah-Boh", 1)
+    cache.update_name("11:22:33:44:55:66", "Ah-Bay", 2)
+    furby = cache.get("AA:BB:CC:DD:EE:FF")
+    assert furby is not None
+    assert (furby.name, furby.name_id) == ("Dah-Boh", 1)
+    assert cache.get("11:22:33:44:55:66") is None
+
+    assert cache.remove("AA:BB:CC:DD:EE:FF")
+    assert not cache.remove("AA:BB:CC:DD:EE:FF")
+    assert cache.get_all() == []
+
+
+def test_failed_save_keeps_previous_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an interrupted save leaves the previous cache file intact."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache = FurbyCache(cache_file)
+    cache.add_or_update("AA:BB:CC:DD:EE:01")
+    previous = cache_file.read_bytes()
+
+    def fail_replace(src: object, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    cache.add_or_update("AA:BB:CC:DD:EE:02")
+
+    assert cache_file.read_bytes() == previous
+    assert [f.address for f in FurbyCache(cache_file).get_all()] == ["AA:BB:CC:DD:EE:01"]
+
+
+def test_add_or_update_with_timestamp(tmp_path: Path) -> None:
+    """Test a caller-supplied last_seen timestamp is stored as given."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    with cache.batch():
+        cache.add_or_update("AA:BB:CC:DD:EE:01", last_seen=1729353600.0)
+        cache.add_or_update("AA:BB:CC:DD:EE:02", last_seen=1729353600.0)
+
+    assert [f.last_seen for f in cache.get_all()] == [1729353600.0, 1729353600.0]
+
+
+def test_add_or_update_many(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test bulk updates share one timestamp and save once."""
+    cache = FurbyCache(tmp_path / "known_furbies.json")
+    cache.add_or_update("AA:BB:CC:DD:EE:01", name="Dah-Boh")
+    writes: list[bytes] = []
+    monkeypatch.setattr(cache, "_write_blob", lambda path, data: writes.append(data))
+
+    furbies = cache.add_or_update_many(
+        [("AA:BB:CC:DD:EE:01", "Furby"), ("AA:BB:CC:DD:EE:02", None)], last_seen=1729353600.0
+    )
+
+    assert len(writes) == 1
+    assert [f.address for f in furbies] == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"]
+    assert furbies[0].name == "Dah-Boh"
+    assert furbies[0].device_name == "Furby"
+    assert {f.last_seen for f in cache.get_all()} == {1729353600.0}
+
+
+def test_add_or_update_with_older_timestamp(tmp_path: Path) -> None:
+    """Test an older caller-supplied timestamp keeps entries ordered by last_seen."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache = FurbyCache(cache_file)
+    cache.add_or_update("AA:BB:CC:DD:EE:01")
+    cache.add_or_update("AA:BB:CC:DD:EE:02", last_seen=0.0)
+
+    addresses = [f.address for f in cache.get_all()]
+    assert addresses == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"]
+    most_recent = cache.get_most_recent()
+    assert most_recent is not None
+    assert most_recent.address == "AA:BB:CC:DD:EE:01"
+    assert [f.address for f in FurbyCache(cache_file).get_all()] == addresses
+
+
+def test_update_name_keeps_last_seen_order(tmp_path: Path) -> None:
+    """Test renaming doesn't move an entry ahead of a newer last_seen."""
+    cache_file = tmp_path / "known_furbies.json"
+    cache = FurbyCache(cache_file)
+    cache.add_or_update("AA:BB:CC:DD:EE:01", last_seen=time.time() + 3600)
+    cache.add_or_update("AA:BB:CC:DD:EE:02", last_seen=0.0)
+    cache.update_name("AA:BB:CC:DD:EE:02", "Dah-Boh", 42)
+
+    addresses = [f.address for f in cache.get_all()]
+    assert addresses == ["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"]
+    most_recent = cache.get_most_recent()
+    assert most_recent is not None
+    assert most_recent.address == "AA:BB:CC:DD:EE:01"
+    assert [f.address for f in FurbyCache(cache_file).get_all()] == addresses
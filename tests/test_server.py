@@ -0,0 +1,59 @@
+"""
+Tests for PyFluff web server.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pyfluff import server
+from pyfluff.server import app, websocket_logs
+
+
+def test_websocket_keepalive_efficiency() -> None:
+    """Test the log WebSocket waits on the client rather than polling with sleep."""
+    names = websocket_logs.__code__.co_names
+    assert "receive_text" in names
+    assert "sleep" not in names
+
+
+def test_websocket_logs_disconnect() -> None:
+    """Test log WebSocket clients are dropped as soon as they disconnect."""
+    with TestClient(app).websocket_connect("/ws/logs"):
+        assert len(server.connection_logs) == 1
+
+    assert server.connection_logs == []
+
+
+class FakeWebSocket:
+    """Records log messages, optionally disconnecting while one is sent."""
+
+    def __init__(self, fail: bool = False, on_send: object = None) -> None:
+        self.fail = fail
+        self.on_send = on_send
+        self.messages: list[dict[str, str]] = []
+
+    async def send_json(self, data: dict[str, str]) -> None:
+        if callable(self.on_send):
+            self.on_send()
+        if self.fail:
+            raise RuntimeError("closed")
+        self.messages.append(data)
+
+
+async def test_broadcast_log_client_disconnects_mid_broadcast(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a client dropping during a broadcast doesn't skip others or raise."""
+    last = FakeWebSocket()
+    # The first client's handler removes it the moment its send fails
+    first = FakeWebSocket(
+        fail=True, on_send=lambda: server.connection_logs.remove(first)
+    )
+    middle = FakeWebSocket()
+    monkeypatch.setattr(server, "connection_logs", [first, middle, last])
+
+    await server.broadcast_log("hello")
+
+    assert middle.messages == [{"message": "hello", "type": "info"}]
+    assert last.messages == [{"message": "hello", "type": "info"}]
+    assert server.connection_logs == [middle, last]